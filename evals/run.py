@@ -6,9 +6,11 @@ Usage:
     python -m evals.run --category routing  # Run specific category
     python -m evals.run --case GS-04        # Run single case
     python -m evals.run --output results/   # Save results to file
+    python -m evals.run --workers 4         # Run cases in 4 processes
 """
 
 import argparse
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -19,7 +21,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 
 from evals.evaluator import TriageEvaluator, print_report, save_report
-from src.main import load_mock_data, run_triage
 
 
 def main():
@@ -46,6 +47,17 @@ def main():
         default="data/mock_intercom.yaml",
         help="Path to mock Intercom data",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to run cases in (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop checking a case at its first failed check",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -55,16 +67,20 @@ def main():
 
     args = parser.parse_args()
 
+    # Evals measure live model behavior: never replay cached LLM responses.
+    # Set before load_dotenv (which doesn't override) and before workers spawn,
+    # so .env and every worker process see it too.
+    os.environ["TRIAGE_LLM_CACHE"] = ""
+
+    # Imported after argument parsing so --help doesn't load the graph stack
+    from src.main import load_mock_data, prepare_triage
+
     # Load environment
     load_dotenv()
 
-    # Load mock data
-    print(f"Loading mock data from {args.mock_data}...")
-    mock_data = load_mock_data(args.mock_data)
-
     # Create evaluator
     print(f"Loading golden set from {args.golden_set}...")
-    evaluator = TriageEvaluator(args.golden_set)
+    evaluator = TriageEvaluator(args.golden_set, fail_fast=args.fail_fast)
 
     # Filter cases if requested
     if args.category:
@@ -83,7 +99,14 @@ def main():
     print("-" * 80)
 
     # Run evaluation
-    report = evaluator.run_all(run_triage, mock_data)
+    if args.workers > 1:
+        # Each worker process builds its own provider, LLM, and graph
+        report = evaluator.run_all(workers=args.workers, mock_data_path=args.mock_data)
+    else:
+        # Build the provider, LLM, and compiled graph once for all cases
+        print(f"Loading mock data from {args.mock_data}...")
+        app, intercom_provider = prepare_triage(load_mock_data(args.mock_data))
+        report = evaluator.run_all(app, intercom_provider)
 
     print("-" * 80)
     print()
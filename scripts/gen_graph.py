@@ -0,0 +1,28 @@
+"""Render the static triage graph image shipped with the package.
+
+Run from the repo root after changing the graph structure:
+    pip install -r requirements-dev.txt  # plus a Graphviz system install
+    python scripts/gen_graph.py
+
+Writes src/_graph.png (read at runtime by src.visualization) and refreshes
+docs/graph.png for the README.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.visualization import GRAPH_IMAGE_PATH, render_graph_image  # noqa: E402
+
+
+def main():
+    render_graph_image(GRAPH_IMAGE_PATH)
+    shutil.copyfile(GRAPH_IMAGE_PATH, ROOT / "docs" / "graph.png")
+    print(f"Graph saved to {GRAPH_IMAGE_PATH} and docs/graph.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,6 @@
 
 from langgraph.graph import END, StateGraph
 
-from .nodes import (
-    analyze_correlation,
-    classify_issue_type,
-    fetch_github,
-    fetch_intercom,
-    fetch_linear,
-    generate_recommendation,
-    intake,
-    route_decision,
-    verify,
-    widen_window,
-)
 from .state import TriageState
 
 
@@ -21,10 +9,30 @@ def build_triage_graph() -> StateGraph:
     """Build and return the triage workflow graph.
 
     Architecture:
-    - classify_issue_type orchestrates the three tool agents (fan-out)
-    - Tool agents (fetch_github, fetch_linear, fetch_intercom) run in parallel
-    - analyze_correlation gathers results from all agents (fan-in)
+    - intake fans out to classify_issue_type and the three tool agents at once,
+      so the classification LLM call overlaps the API fetches
+    - Tool agents (fetch_github, fetch_linear, fetch_intercom) run in parallel:
+      LangGraph executes all nodes of a superstep concurrently (on a thread pool
+      for sync invoke), so latency is the slowest branch, not the sum
+    - fetch_github speculatively searches every mapped repo on the first pass;
+      filter_prs gathers all branches (fan-in) and keeps the classified repos
+    - analyze_correlation runs on the filtered context
     """
+    # Deferred so importing this module doesn't pull in the LLM client stack
+    from .nodes import (
+        analyze_correlation,
+        classify_issue_type,
+        fetch_github,
+        fetch_intercom,
+        fetch_linear,
+        filter_prs,
+        generate_recommendation,
+        intake,
+        route_decision,
+        verify,
+        widen_window,
+    )
+
     graph = StateGraph(TriageState)
 
     # Add nodes - each integration has its own focused agent
@@ -35,6 +43,7 @@ def build_triage_graph() -> StateGraph:
     graph.add_node("fetch_github", fetch_github)
     graph.add_node("fetch_linear", fetch_linear)
     graph.add_node("fetch_intercom", fetch_intercom)
+    graph.add_node("filter_prs", filter_prs)
 
     # Orchestration nodes
     graph.add_node("analyze_correlation", analyze_correlation)
@@ -45,18 +54,19 @@ def build_triage_graph() -> StateGraph:
     # Set entry point
     graph.set_entry_point("intake")
 
-    # Main flow
+    # Fan-out: classification and all three tool agents start together
     graph.add_edge("intake", "classify_issue_type")
-
-    # Fan-out: classify_issue_type orchestrates all three tool agents
-    graph.add_edge("classify_issue_type", "fetch_github")
-    graph.add_edge("classify_issue_type", "fetch_linear")
-    graph.add_edge("classify_issue_type", "fetch_intercom")
-
-    # Fan-in: all tool agents converge at analyze_correlation
-    graph.add_edge("fetch_github", "analyze_correlation")
-    graph.add_edge("fetch_linear", "analyze_correlation")
-    graph.add_edge("fetch_intercom", "analyze_correlation")
+    graph.add_edge("intake", "fetch_github")
+    graph.add_edge("intake", "fetch_linear")
+    graph.add_edge("intake", "fetch_intercom")
+
+    # Fan-in: every branch finishes in the same superstep and converges at
+    # filter_prs, which narrows the speculative GitHub results
+    graph.add_edge("classify_issue_type", "filter_prs")
+    graph.add_edge("fetch_github", "filter_prs")
+    graph.add_edge("fetch_linear", "filter_prs")
+    graph.add_edge("fetch_intercom", "filter_prs")
+    graph.add_edge("filter_prs", "analyze_correlation")
 
     # Routing decision after analysis
     graph.add_conditional_edges(
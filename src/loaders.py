@@ -0,0 +1,26 @@
+"""Cached YAML loading shared by the CLI and the eval harness."""
+
+import functools
+import os
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> dict:
+    """Parse a YAML file, memoized on (path, mtime) so edits are picked up."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml(path: str) -> dict:
+    """Load a YAML file, reusing the parsed result until the file changes.
+
+    The result is shared between callers, so treat it as read-only.
+    """
+    return _load_yaml_cached(path, os.path.getmtime(path))
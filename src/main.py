@@ -1,22 +1,28 @@
 """Main entry point for running the triage graph."""
 
 import argparse
+import functools
 import os
 
-import yaml
 from dotenv import load_dotenv
-from langchain_ollama import ChatOllama
 
-from .graph import create_triage_app
-from .nodes import init_dependencies
+from .loaders import load_yaml
 from .providers import IntercomProvider
-from .visualization import save_graph_image
+
+# Client-side Ollama options shared by every model: keep models resident between
+# bursts and size the context for the correlation prompt. Thread count is left
+# to Ollama's own default (physical cores)
+OLLAMA_OPTIONS = {
+    "keep_alive": "24h",
+    "num_ctx": 4096,
+}
 
 
 def load_mock_data(path: str | None = None) -> dict:
     """Load mock data from YAML file.
 
     Checks for proprietary data first (gitignored), falls back to public mock data.
+    Parsed data is cached until the file changes, so treat it as read-only.
 
     Args:
         path: Optional explicit path. If not provided, checks proprietary then public.
@@ -33,8 +39,7 @@ def load_mock_data(path: str | None = None) -> dict:
             path = public_path
             print(f"Using public mock data: {path}")
 
-    with open(path) as f:
-        return yaml.safe_load(f)
+    return load_yaml(path)
 
 
 def setup_langsmith():
@@ -44,26 +49,43 @@ def setup_langsmith():
     print(f"LangSmith tracing enabled (project: {os.environ['LANGCHAIN_PROJECT']})")
 
 
-def run_triage(
-    ticket_id: str,
-    mock_data: dict | None = None,
-    reference_date: str | None = None,
-) -> dict:
-    """Run the triage graph on a ticket.
+_initialized = False
+
+
+def _init_once():
+    """Load environment variables and configure tracing once per process."""
+    global _initialized
+    if _initialized:
+        return
+    load_dotenv()
+    setup_langsmith()
+    _initialized = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    """Build and compile the triage graph once per process."""
+    from .graph import create_triage_app
+
+    return create_triage_app()
+
+
+def prepare_triage(mock_data: dict | None = None) -> tuple:
+    """Set up the provider, LLM, and compiled graph for running triage.
 
     Args:
-        ticket_id: The Intercom ticket ID to process
         mock_data: Optional mock data dict. If not provided, loads from file.
-        reference_date: ISO date string to use as "today" for time windows.
 
     Returns:
-        The final state after triage
+        (app, intercom_provider) ready for run_triage_with_app
     """
-    # Load environment variables
-    load_dotenv()
+    # Deferred so CLI startup and argument parsing don't pay for LangChain imports
+    from langchain_ollama import ChatOllama
 
-    # Setup LangSmith tracing
-    setup_langsmith()
+    from .nodes import init_dependencies
+
+    # Load environment variables and setup LangSmith tracing (first call only)
+    _init_once()
 
     # Load mock data if not provided
     if mock_data is None:
@@ -72,14 +94,32 @@ def run_triage(
     # Initialize provider and LLM
     # IntercomProvider checks INTERCOM_MODE env var (default: "mock")
     intercom_provider = IntercomProvider(mock_data)
-    llm = ChatOllama(model="llama3.2")
+    llm = ChatOllama(model="llama3.2", **OLLAMA_OPTIONS)
+    classifier_llm = ChatOllama(model="llama3.2:1b", **OLLAMA_OPTIONS)  # Routing task; smaller model is enough
 
     # Initialize dependencies
-    init_dependencies(intercom_provider, llm)
+    init_dependencies(intercom_provider, llm, classifier_llm)
+
+    return _get_app(), intercom_provider
+
+
+def run_triage_with_app(
+    app,
+    intercom_provider: IntercomProvider,
+    ticket_id: str,
+    reference_date: str | None = None,
+) -> dict:
+    """Run an already-compiled triage graph on a ticket.
 
-    # Create the app
-    app = create_triage_app()
+    Args:
+        app: Compiled graph from prepare_triage
+        intercom_provider: Provider used to fetch the ticket
+        ticket_id: The Intercom ticket ID to process
+        reference_date: ISO date string to use as "today" for time windows.
 
+    Returns:
+        The final state after triage
+    """
     # Get the ticket
     ticket = intercom_provider.fetch_ticket(ticket_id)
 
@@ -87,9 +127,81 @@ def run_triage(
     initial_state = {"ticket": ticket}
     if reference_date:
         initial_state["reference_date"] = reference_date
-    final_state = app.invoke(initial_state)
+    return app.invoke(initial_state)
+
+
+def run_triage(
+    ticket_id: str,
+    mock_data: dict | None = None,
+    reference_date: str | None = None,
+) -> dict:
+    """Run the triage graph on a ticket.
 
-    return final_state
+    Args:
+        ticket_id: The Intercom ticket ID to process
+        mock_data: Optional mock data dict. If not provided, loads from file.
+        reference_date: ISO date string to use as "today" for time windows.
+
+    Returns:
+        The final state after triage
+    """
+    app, intercom_provider = prepare_triage(mock_data)
+    return run_triage_with_app(app, intercom_provider, ticket_id, reference_date)
+
+
+def run_triage_batch(
+    ticket_ids: list[str],
+    mock_data: dict | None = None,
+    reference_date: str | None = None,
+    max_concurrency: int = 10,
+) -> list:
+    """Run the triage graph on several tickets concurrently.
+
+    Uses the compiled graph's batch API, so up to max_concurrency graph runs
+    (and their LLM calls) are in flight at once. Actual LLM parallelism is
+    bounded by the Ollama server (OLLAMA_NUM_PARALLEL).
+
+    Args:
+        ticket_ids: The Intercom ticket IDs to process
+        mock_data: Optional mock data dict. If not provided, loads from file.
+        reference_date: ISO date string to use as "today" for time windows.
+        max_concurrency: Maximum number of tickets triaged at once
+
+    Returns:
+        Final states in ticket_ids order. A ticket that could not be fetched,
+        or whose run raised, is returned as its exception instead of failing
+        the whole batch.
+    """
+    app, intercom_provider = prepare_triage(mock_data)
+
+    final_states = [None] * len(ticket_ids)
+    initial_states = {}
+    for i, ticket_id in enumerate(ticket_ids):
+        try:
+            ticket = intercom_provider.fetch_ticket(ticket_id)
+        except Exception as e:
+            final_states[i] = e
+            continue
+        initial_state = {"ticket": ticket}
+        if reference_date:
+            initial_state["reference_date"] = reference_date
+        initial_states[i] = initial_state
+
+    # Schedule tickets shortest-body first so runs in flight together have
+    # similar prompt/response lengths, then restore the caller's order
+    order = sorted(
+        initial_states,
+        key=lambda i: len(initial_states[i]["ticket"].get("body") or ""),
+    )
+    results = app.batch(
+        [initial_states[i] for i in order],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+
+    for i, result in zip(order, results):
+        final_states[i] = result
+    return final_states
 
 
 def main():
@@ -108,6 +220,8 @@ def main():
     )
     args = parser.parse_args()
 
+    from .visualization import save_graph_image
+
     # Save graph image
     print("\n" + "=" * 60)
     print("TRIAGE GRAPH")
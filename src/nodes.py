@@ -1,12 +1,15 @@
 """Node functions for the triage graph."""
 
+import functools
 import json
 import logging
 import os
 import re
 from typing import Literal
 
+from json_repair import repair_json
 from langchain_ollama import ChatOllama
+from pydantic import BaseModel
 
 from .prompts import (
     ANALYZE_CORRELATION_PROMPT,
@@ -14,6 +17,7 @@ from .prompts import (
     GENERATE_RECOMMENDATION_PROMPT,
 )
 from .providers import IntercomProvider
+from .schemas import ClassifyResult, CorrelationResult, RecommendationResult
 from .state import TriageState
 from .tools import fetch_github_prs, fetch_linear_tickets
 
@@ -24,7 +28,24 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
-
+# Per-node loggers, created once at import rather than looked up on every call
+_log_init = logging.getLogger("init")
+_log_parse = logging.getLogger("parse_json")
+_log_intake = logging.getLogger("intake")
+_log_classify = logging.getLogger("classify")
+_log_fetch_github = logging.getLogger("fetch_github")
+_log_fetch_linear = logging.getLogger("fetch_linear")
+_log_fetch_intercom = logging.getLogger("fetch_intercom")
+_log_filter_prs = logging.getLogger("filter_prs")
+_log_analyze = logging.getLogger("analyze")
+_log_route = logging.getLogger("route")
+_log_widen_window = logging.getLogger("widen_window")
+_log_recommend = logging.getLogger("recommend")
+_log_verify = logging.getLogger("verify")
+
+
+# Config is read from the environment once per process, on first use
+@functools.lru_cache(maxsize=1)
 def _get_repo_map() -> dict[str, list[str]]:
     """Get repo mapping from environment or use defaults.
 
@@ -58,6 +79,7 @@ def _get_repo_map() -> dict[str, list[str]]:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def _get_linear_projects() -> list[str] | None:
     """Get Linear projects from environment or use defaults.
 
@@ -72,36 +94,100 @@ def _get_linear_projects() -> list[str] | None:
     return ["ENG", "INFRA"]  # Default example projects
 
 
-# Module-level cache (computed on first use)
-REPO_MAP: dict[str, list[str]] | None = None
-LINEAR_PROJECTS: list[str] | None = None
-
-
-def _ensure_config():
-    """Initialize config from environment on first use."""
-    global REPO_MAP, LINEAR_PROJECTS
-    if REPO_MAP is None:
-        REPO_MAP = _get_repo_map()
-        LINEAR_PROJECTS = _get_linear_projects()
-
 # Module-level dependencies (initialized via init_dependencies before graph runs)
 # This pattern allows nodes to access shared resources without passing them through state.
 # Tradeoff: Simpler node signatures, but harder to test in isolation.
 # Alternative: Pass dependencies via LangGraph's configurable or RunnableConfig.
 _intercom_provider: IntercomProvider = None
 _llm: ChatOllama = None
+_classifier_llm: ChatOllama = None
+
+# Generation cap for classification; its JSON output is always a couple of short fields
+CLASSIFY_MAX_TOKENS = 128
+
+
+def _with_max_tokens(llm: ChatOllama, max_tokens: int) -> ChatOllama:
+    """Return a copy of an Ollama chat model that stops after max_tokens tokens.
+
+    Other chat models, or ones with num_predict already set, are returned as-is.
+    """
+    if isinstance(llm, ChatOllama) and llm.num_predict is None:
+        return llm.model_copy(update={"num_predict": max_tokens})
+    return llm
+
+
+_llm_cache_configured = False
+
+
+def _configure_llm_cache():
+    """Install a global LangChain LLM cache so repeated identical prompts skip inference.
+
+    Opt-in. Configure via: TRIAGE_LLM_CACHE=.triage_llm_cache.db (SQLite file)
+    or "memory" for an in-process cache. Unset or empty disables caching.
+    """
+    global _llm_cache_configured
+    if _llm_cache_configured:
+        return
+    _llm_cache_configured = True
+
+    target = os.environ.get("TRIAGE_LLM_CACHE", "").strip()
+    if not target:
+        return
 
+    from langchain_core.globals import set_llm_cache
 
-def init_dependencies(intercom_provider: IntercomProvider, llm: ChatOllama):
+    if target != "memory":
+        try:
+            from langchain_community.cache import SQLiteCache
+
+            set_llm_cache(SQLiteCache(database_path=target))
+            return
+        except ImportError:
+            _log_init.warning(
+                "langchain-community not installed; using in-memory LLM cache"
+            )
+
+    from langchain_core.caches import InMemoryCache
+
+    set_llm_cache(InMemoryCache())
+
+
+def _warn_untuned_ollama(*llms: ChatOllama | None) -> None:
+    """Warn about Ollama models left on defaults that hurt concurrent runs.
+
+    Without keep_alive the server unloads the model after 5 minutes idle, and
+    the default 2048-token context silently truncates long correlation prompts.
+    """
+    for llm in llms:
+        if not isinstance(llm, ChatOllama):
+            continue
+        unset = [name for name in ("keep_alive", "num_ctx") if getattr(llm, name) is None]
+        if unset:
+            _log_init.warning(
+                "ChatOllama(model=%r) has no %s set; see OLLAMA_OPTIONS in src/main.py "
+                "and start the server with OLLAMA_NUM_PARALLEL for concurrent triage",
+                llm.model,
+                "/".join(unset),
+            )
+
+
+def init_dependencies(
+    intercom_provider: IntercomProvider,
+    llm: ChatOllama,
+    classifier_llm: ChatOllama | None = None,
+):
     """Initialize shared dependencies before running the graph.
 
     Must be called before invoking the graph. This sets up:
     - The Intercom provider (mock or real) for fetching tickets
-    - The LLM instance for classification and analysis
+    - The LLM instances for classification and for analysis/recommendation
+    - The LLM response cache (see _configure_llm_cache), on first call
 
     Args:
         intercom_provider: Provider for Intercom API (use MockIntercomProvider for testing)
-        llm: LangChain chat model (e.g., ChatOllama with llama3.2)
+        llm: LangChain chat model for analysis and recommendation (e.g., ChatOllama with llama3.2)
+        classifier_llm: Optional smaller/faster chat model for classification
+            (e.g., ChatOllama with llama3.2:1b). Defaults to llm.
 
     Example:
         from src.providers import get_intercom_provider
@@ -109,12 +195,30 @@ def init_dependencies(intercom_provider: IntercomProvider, llm: ChatOllama):
 
         init_dependencies(
             intercom_provider=get_intercom_provider(),
-            llm=ChatOllama(model="llama3.2")
+            llm=ChatOllama(model="llama3.2", keep_alive="24h", num_ctx=4096),
+            classifier_llm=ChatOllama(model="llama3.2:1b", keep_alive="24h", num_ctx=4096),
         )
     """
-    global _intercom_provider, _llm
+    global _intercom_provider, _llm, _classifier_llm
     _intercom_provider = intercom_provider
     _llm = llm
+    _classifier_llm = _with_max_tokens(classifier_llm or llm, CLASSIFY_MAX_TOKENS)
+    _warn_untuned_ollama(llm, classifier_llm)
+    _configure_llm_cache()
+
+
+# Ticket bodies are truncated to this length in prompts; the opening carries the signal
+MAX_PROMPT_BODY_CHARS = 800
+
+# Caps on fetched context listed in the correlation prompt
+MAX_PROMPT_PRS = 20
+MAX_PROMPT_LINEAR = 20
+MAX_PROMPT_INTERCOM = 30
+MAX_PROMPT_TITLE_CHARS = 120
+
+# Patterns used to extract JSON from LLM responses
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_JSON_OBJ_RE = re.compile(r"\{[\s\S]*\}")
 
 
 def _parse_json_response(text: str) -> dict:
@@ -122,69 +226,76 @@ def _parse_json_response(text: str) -> dict:
 
     Handles common LLM output patterns:
     - JSON wrapped in ```json code blocks
-    - JSON with trailing commas
-    - Unquoted string values
-    - Raw JSON in text
+    - Raw JSON in surrounding text
+    - Malformed JSON (trailing commas, unquoted or single-quoted values,
+      Python literals, missing commas), repaired with json-repair when
+      strict parsing fails
     """
-    log = logging.getLogger("parse_json")
+    log = _log_parse
 
     # Strip markdown code blocks if present
     if "```" in text:
-        match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", text)
+        match = _CODE_FENCE_RE.search(text)
         if match:
             text = match.group(1)
 
     # Find JSON object in text
-    match = re.search(r"\{[\s\S]*\}", text)
+    match = _JSON_OBJ_RE.search(text)
     if not match:
-        log.error(f"No JSON object found in LLM response:\n{text}")
+        log.error("No JSON object found in LLM response:\n%s", text)
         raise json.JSONDecodeError("No JSON object found", text, 0)
 
     json_str = match.group(0)
 
-    # Fix trailing commas (common LLM error)
-    json_str = re.sub(r",(\s*[}\]])", r"\1", json_str)
-
-    # Fix unquoted string values (common LLM error)
-    # Pattern: "key": unquoted_text", (missing opening quote, has closing quote)
-    # Example: "reason": The issue doesn't match...",
-    json_str = re.sub(
-        r'"(\w+)":\s+([A-Za-z][^"]+)",',
-        lambda m: f'"{m.group(1)}": "{m.group(2)}",',
-        json_str,
-    )
-
+    # Fast path: well-formed JSON
     try:
         return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        log.error(f"Failed to parse JSON from LLM response:\n{json_str}")
-        raise e
+    except json.JSONDecodeError:
+        pass
+
+    result = repair_json(json_str, return_objects=True)
+    if not isinstance(result, dict):
+        log.error("Failed to parse JSON from LLM response:\n%s", json_str)
+        raise json.JSONDecodeError("Could not repair JSON object", json_str, 0)
+    return result
+
 
+def _invoke_structured(llm: ChatOllama, prompt: str, schema: type[BaseModel]) -> dict:
+    """Invoke the LLM with schema-constrained JSON output and return it as a dict.
 
-def intake(state: TriageState) -> TriageState:
+    Falls back to extracting/repairing JSON from the raw message text if the
+    structured parse fails (e.g. a model without JSON schema support).
+    """
+    structured_llm = llm.with_structured_output(schema, method="json_schema", include_raw=True)
+    output = structured_llm.invoke(prompt)
+    if output["parsed"] is not None:
+        return output["parsed"].model_dump()
+    return _parse_json_response(output["raw"].content)
+
+
+def intake(state: TriageState) -> dict:
     """Parse and validate incoming Intercom ticket."""
-    log = logging.getLogger("intake")
+    log = _log_intake
     log.info("=" * 60)
     log.info("Processing new ticket")
     ticket = state.get("ticket")
 
     if not ticket:
         log.error("No ticket provided")
-        return {**state, "error": "No ticket provided"}
+        return {"error": "No ticket provided"}
 
     # Validate required fields
     required = ["subject", "body"]
     missing = [f for f in required if not ticket.get(f)]
     if missing:
-        log.error(f"Ticket missing required fields: {missing}")
-        return {**state, "error": f"Ticket missing required fields: {missing}"}
+        log.error("Ticket missing required fields: %s", missing)
+        return {"error": f"Ticket missing required fields: {missing}"}
 
-    log.info(f"Subject: {ticket['subject']}")
-    log.info(f"Body: {ticket['body'][:100]}...")
+    log.info("Subject: %s", ticket["subject"])
+    log.info("Body: %s...", ticket["body"][:100])
 
     # Initialize state for processing
     return {
-        **state,
         "retry_count": 0,
         "days_back": 1,
         "fetch_failures": [],
@@ -192,119 +303,144 @@ def intake(state: TriageState) -> TriageState:
     }
 
 
-def classify_issue_type(state: TriageState) -> TriageState:
+def classify_issue_type(state: TriageState) -> dict:
     """Use LLM to classify the ticket as frontend, backend, infra, or unclear."""
-    _ensure_config()
-    log = logging.getLogger("classify")
+    log = _log_classify
     log.info("-" * 60)
     log.info("Determining issue type with LLM")
     ticket = state["ticket"]
 
     prompt = CLASSIFY_ISSUE_PROMPT.format(
         subject=ticket["subject"],
-        body=ticket["body"],
+        body=ticket["body"][:MAX_PROMPT_BODY_CHARS],
     )
 
     log.info("Calling LLM...")
-    response = _llm.invoke(prompt)
-    result = _parse_json_response(response.content)
+    result = _invoke_structured(_classifier_llm, prompt, ClassifyResult)
 
     issue_type = result.get("issue_type", "unclear")
-    if issue_type not in REPO_MAP:
+    repo_map = _get_repo_map()
+    if issue_type not in repo_map:
         issue_type = "unclear"
 
-    target_repos = REPO_MAP[issue_type]
+    target_repos = repo_map[issue_type]
 
-    log.info(f"Result: {issue_type}")
-    log.info(f"Reasoning: {result.get('reasoning', 'N/A')}")
-    log.info(f"Target repos: {target_repos}")
+    log.info("Result: %s", issue_type)
+    log.info("Reasoning: %s", result.get("reasoning", "N/A"))
+    log.info("Target repos: %s", target_repos)
 
     return {
-        **state,
         "issue_type": issue_type,
         "target_repos": target_repos,
     }
 
 
+def _all_repos() -> list[str]:
+    """Every repo in the repo map, deduplicated in map order."""
+    return list(dict.fromkeys(repo for repos in _get_repo_map().values() for repo in repos))
+
+
 def fetch_github(state: TriageState) -> dict:
-    """GitHub agent: Fetch PRs merged to main from target repos."""
-    log = logging.getLogger("fetch_github")
+    """GitHub agent: Fetch PRs merged to main from target repos.
+
+    On the first pass this runs alongside classification, before target_repos
+    is known, so it speculatively fetches every mapped repo; filter_prs then
+    narrows the results once the classification lands.
+    """
+    log = _log_fetch_github
     log.info("-" * 60)
     log.info("Fetching merged PRs")
     days_back = state.get("days_back", 1)
     reference_date = state.get("reference_date")
-    target_repos = state.get("target_repos", [])
-    failures = list(state.get("fetch_failures", []))
+    target_repos = state.get("target_repos") or _all_repos()
+    failures = []  # Only this source; merge_lists accumulates across fetches
 
-    log.info(f"Time window: {days_back} day(s) from {reference_date or 'today'}")
-    log.info(f"Target repos: {target_repos}")
+    log.info("Time window: %s day(s) from %s", days_back, reference_date or "today")
+    log.info("Target repos: %s", target_repos)
 
     try:
         recent_prs = fetch_github_prs(target_repos, days_back, reference_date)
-        log.info(f"Found {len(recent_prs)} PRs")
+        log.info("Found %d PRs", len(recent_prs))
         for pr in recent_prs[:3]:  # Log first 3
-            log.info(f"  - {pr['title']}")
+            log.info("  - %s", pr["title"])
     except Exception as e:
-        log.warning(f"Failed: {e}")
+        log.warning("Failed: %s", e)
         recent_prs = []
-        if "github" not in failures:
-            failures.append("github")
+        failures.append("github")
 
     return {"recent_prs": recent_prs, "fetch_failures": failures}
 
 
 def fetch_linear(state: TriageState) -> dict:
     """Linear agent: Fetch recently deployed tickets."""
-    _ensure_config()
-    log = logging.getLogger("fetch_linear")
+    log = _log_fetch_linear
     log.info("-" * 60)
     log.info("Fetching deployed tickets")
     days_back = state.get("days_back", 1)
     reference_date = state.get("reference_date")
-    failures = list(state.get("fetch_failures", []))
+    failures = []
+    linear_projects = _get_linear_projects()
 
-    log.info(f"Time window: {days_back} day(s) from {reference_date or 'today'}")
-    log.info(f"Projects: {LINEAR_PROJECTS}")
+    log.info("Time window: %s day(s) from %s", days_back, reference_date or "today")
+    log.info("Projects: %s", linear_projects)
 
     try:
-        recent_linear = fetch_linear_tickets(days_back, projects=LINEAR_PROJECTS, reference_date=reference_date)
-        log.info(f"Found {len(recent_linear)} tickets")
+        recent_linear = fetch_linear_tickets(days_back, projects=linear_projects, reference_date=reference_date)
+        log.info("Found %d tickets", len(recent_linear))
         for ticket in recent_linear[:3]:  # Log first 3
-            log.info(f"  - {ticket['title']}")
+            log.info("  - %s", ticket["title"])
     except Exception as e:
-        log.warning(f"Failed: {e}")
+        log.warning("Failed: %s", e)
         recent_linear = []
-        if "linear" not in failures:
-            failures.append("linear")
+        failures.append("linear")
 
     return {"recent_linear_tickets": recent_linear, "fetch_failures": failures}
 
 
 def fetch_intercom(state: TriageState) -> dict:
     """Intercom agent: Fetch recent tickets for pattern detection."""
-    log = logging.getLogger("fetch_intercom")
+    log = _log_fetch_intercom
     log.info("-" * 60)
     log.info("Fetching recent tickets")
     days_back = state.get("days_back", 1)
-    failures = list(state.get("fetch_failures", []))
+    failures = []
 
-    log.info(f"Time window: {days_back} day(s)")
+    log.info("Time window: %s day(s)", days_back)
 
     try:
         recent_intercom = _intercom_provider.fetch_recent_tickets(days_back)
-        log.info(f"Found {len(recent_intercom)} tickets")
+        log.info("Found %d tickets", len(recent_intercom))
     except Exception as e:
-        log.warning(f"Failed: {e}")
+        log.warning("Failed: %s", e)
         recent_intercom = []
-        if "intercom" not in failures:
-            failures.append("intercom")
+        failures.append("intercom")
 
     return {"recent_intercom_tickets": recent_intercom, "fetch_failures": failures}
 
 
-def analyze_correlation(state: TriageState) -> TriageState:
+def filter_prs(state: TriageState) -> dict:
+    """Keep only the fetched PRs from the repos chosen by classification."""
+    log = _log_filter_prs
+    target_repos = set(state.get("target_repos", []))
+    recent_prs = state.get("recent_prs", [])
+
+    filtered = [pr for pr in recent_prs if pr.get("repo") in target_repos]
+    if len(filtered) != len(recent_prs):
+        log.info("Kept %d of %d PRs from target repos", len(filtered), len(recent_prs))
+
+    return {"recent_prs": filtered}
+
+
+def _most_recent(items: list[dict], date_key: str, limit: int) -> list[dict]:
+    """Return up to `limit` items, newest first by their ISO date field."""
+    if len(items) <= limit:
+        return items
+    return sorted(items, key=lambda item: str(item.get(date_key) or ""), reverse=True)[:limit]
+
+
+def analyze_correlation(state: TriageState) -> dict:
     """Use LLM to determine if ticket relates to recent changes."""
-    log = logging.getLogger("analyze")
+    log = _log_analyze
     log.info("-" * 60)
     log.info("Correlating ticket with recent changes")
     ticket = state["ticket"]
@@ -312,37 +448,38 @@ def analyze_correlation(state: TriageState) -> TriageState:
     linear_tickets = state.get("recent_linear_tickets", [])
     intercom_tickets = state.get("recent_intercom_tickets", [])
 
-    # Format summaries for the prompt
+    # Exclude current ticket from intercom summary
+    other_tickets = [t for t in intercom_tickets if t.get("id") != ticket.get("id")]
+
+    log.info("PRs: %d, Linear: %d, Intercom: %d", len(prs), len(linear_tickets), len(other_tickets))
+
+    # Format summaries for the prompt, keeping only the most recent items so a
+    # widened window doesn't grow the prompt without bound
     prs_summary = "\n".join([
-        f"- [{pr['repo']}] {pr['title']} (merged: {pr['merged_at'][:10]})"
-        for pr in prs
+        f"- [{pr['repo']}] {pr['title'][:MAX_PROMPT_TITLE_CHARS]} (merged: {pr['merged_at'][:10]})"
+        for pr in _most_recent(prs, "merged_at", MAX_PROMPT_PRS)
     ]) or "No recent PRs found."
 
     linear_summary = "\n".join([
-        f"- {t['title']} (deployed: {t['deployed_at'][:10]})"
-        for t in linear_tickets
+        f"- {t['title'][:MAX_PROMPT_TITLE_CHARS]} (deployed: {t['deployed_at'][:10]})"
+        for t in _most_recent(linear_tickets, "deployed_at", MAX_PROMPT_LINEAR)
     ]) or "No recent Linear tickets found."
 
-    # Exclude current ticket from intercom summary
-    other_tickets = [t for t in intercom_tickets if t.get("id") != ticket.get("id")]
     intercom_summary = "\n".join([
-        f"- [{t.get('id', 'unknown')}] {t['subject']}"
-        for t in other_tickets
+        f"- [{t.get('id', 'unknown')}] {t['subject'][:MAX_PROMPT_TITLE_CHARS]}"
+        for t in _most_recent(other_tickets, "created_at", MAX_PROMPT_INTERCOM)
     ]) or "No other recent tickets."
 
-    log.info(f"PRs: {len(prs)}, Linear: {len(linear_tickets)}, Intercom: {len(other_tickets)}")
-
     prompt = ANALYZE_CORRELATION_PROMPT.format(
         ticket_subject=ticket["subject"],
-        ticket_body=ticket["body"],
+        ticket_body=ticket["body"][:MAX_PROMPT_BODY_CHARS],
         prs_summary=prs_summary,
         linear_summary=linear_summary,
         intercom_summary=intercom_summary,
     )
 
     log.info("Calling LLM...")
-    response = _llm.invoke(prompt)
-    result = _parse_json_response(response.content)
+    result = _invoke_structured(_llm, prompt, CorrelationResult)
 
     correlation_result = {
         "correlated": result.get("correlated", False),
@@ -358,15 +495,19 @@ def analyze_correlation(state: TriageState) -> TriageState:
         "pattern_summary": result.get("pattern_summary"),
     }
 
-    log.info(f"Correlated: {correlation_result['correlated']} (confidence: {correlation_result['confidence']})")
-    log.info(f"Type: {correlation_result['correlation_type']}")
+    log.info(
+        "Correlated: %s (confidence: %s)", correlation_result["correlated"], correlation_result["confidence"]
+    )
+    log.info("Type: %s", correlation_result["correlation_type"])
     reason = correlation_result['reason']
-    log.info(f"Reason: {reason[:80]}..." if len(reason) > 80 else f"Reason: {reason}")
+    if len(reason) > 80:
+        log.info("Reason: %s...", reason[:80])
+    else:
+        log.info("Reason: %s", reason)
     if recurring_pattern["is_recurring"]:
-        log.info(f"Recurring pattern: {recurring_pattern['pattern_summary']}")
+        log.info("Recurring pattern: %s", recurring_pattern["pattern_summary"])
 
     return {
-        **state,
         "correlation_result": correlation_result,
         "recurring_pattern": recurring_pattern,
     }
@@ -374,7 +515,7 @@ def analyze_correlation(state: TriageState) -> TriageState:
 
 def route_decision(state: TriageState) -> Literal["correlated", "not_correlated", "low_confidence"]:
     """Determine the next step based on correlation analysis."""
-    log = logging.getLogger("route")
+    log = _log_route
     log.info("-" * 60)
     log.info("Determining next step")
     result = state.get("correlation_result", {})
@@ -385,7 +526,9 @@ def route_decision(state: TriageState) -> Literal["correlated", "not_correlated"
     is_correlated = result.get("correlated", False)
     is_recurring = recurring.get("is_recurring", False)
 
-    log.info(f"Confidence: {confidence}, Correlated: {is_correlated}, Recurring: {is_recurring}, Retries: {retry_count}")
+    log.info(
+        "Confidence: %s, Correlated: %s, Recurring: %s, Retries: %s", confidence, is_correlated, is_recurring, retry_count
+    )
 
     # If correlated with high confidence, or recurring pattern detected
     if (is_correlated and confidence >= 0.7) or is_recurring:
@@ -401,9 +544,9 @@ def route_decision(state: TriageState) -> Literal["correlated", "not_correlated"
     return "not_correlated"
 
 
-def widen_window(state: TriageState) -> TriageState:
+def widen_window(state: TriageState) -> dict:
     """Increase time window for retry loop."""
-    log = logging.getLogger("widen_window")
+    log = _log_widen_window
     log.info("-" * 60)
     log.info("Expanding search time range")
     retry_count = state.get("retry_count", 0)
@@ -412,29 +555,24 @@ def widen_window(state: TriageState) -> TriageState:
     # Widen: 1 -> 3 -> 7 days
     new_days = {1: 3, 3: 7}.get(current_days, 7)
 
-    log.info(f"Retry {retry_count + 1}: {current_days} → {new_days} days")
+    log.info("Retry %d: %s → %s days", retry_count + 1, current_days, new_days)
 
     return {
-        **state,
         "retry_count": retry_count + 1,
         "days_back": new_days,
     }
 
 
-def generate_recommendation(state: TriageState) -> TriageState:
-    """Generate triage recommendation based on analysis."""
-    log = logging.getLogger("recommend")
-    log.info("-" * 60)
-    log.info("Generating actionable recommendation")
+def _build_recommendation_prompt(state: TriageState) -> str:
+    """Format the recommendation prompt from the ticket and analysis in state."""
     ticket = state["ticket"]
-    issue_type = state.get("issue_type", "unclear")
     correlation = state.get("correlation_result", {})
     recurring = state.get("recurring_pattern", {})
 
-    prompt = GENERATE_RECOMMENDATION_PROMPT.format(
+    return GENERATE_RECOMMENDATION_PROMPT.format(
         ticket_subject=ticket["subject"],
-        ticket_body=ticket["body"],
-        issue_type=issue_type,
+        ticket_body=ticket["body"][:MAX_PROMPT_BODY_CHARS],
+        issue_type=state.get("issue_type", "unclear"),
         correlated=correlation.get("correlated", False),
         confidence=correlation.get("confidence", 0.0),
         matched_item=correlation.get("matched_item"),
@@ -444,10 +582,23 @@ def generate_recommendation(state: TriageState) -> TriageState:
         pattern_summary=recurring.get("pattern_summary"),
     )
 
+
+def generate_recommendation(state: TriageState) -> dict:
+    """Generate triage recommendation based on analysis.
+
+    Callers that want the response token by token can run the graph with
+    app.stream(state, stream_mode="messages") and keep the chunks whose
+    metadata["langgraph_node"] is "generate_recommendation".
+    """
+    log = _log_recommend
+    log.info("-" * 60)
+    log.info("Generating actionable recommendation")
+
+    prompt = _build_recommendation_prompt(state)
+
     log.info("Calling LLM...")
-    response = _llm.invoke(prompt)
-    log.info(f"Raw LLM response:\n{response.content}")
-    result = _parse_json_response(response.content)
+    result = _invoke_structured(_llm, prompt, RecommendationResult)
+    log.info("LLM response: %s", result)
 
     recommendation = {
         "suggested_tags": result.get("suggested_tags", []),
@@ -458,12 +609,11 @@ def generate_recommendation(state: TriageState) -> TriageState:
         "engineering_context": result.get("engineering_context"),
     }
 
-    log.info(f"Tags: {recommendation['suggested_tags']}")
-    log.info(f">>> Next action: {recommendation['next_action'].upper()}")
-    log.info(f"Reason: {recommendation['next_action_reason']}")
+    log.info("Tags: %s", recommendation["suggested_tags"])
+    log.info(">>> Next action: %s", recommendation["next_action"].upper())
+    log.info("Reason: %s", recommendation["next_action_reason"])
 
     return {
-        **state,
         "recommendation": recommendation,
     }
 
@@ -495,9 +645,9 @@ def _print_final_output(state: TriageState) -> None:
     print("=" * 60 + "\n")
 
 
-def verify(state: TriageState) -> TriageState:
+def verify(state: TriageState) -> dict:
     """Verify the recommendation was generated correctly."""
-    log = logging.getLogger("verify")
+    log = _log_verify
     log.info("-" * 60)
     log.info("Validating recommendation")
     recommendation = state.get("recommendation", {})
@@ -506,23 +656,23 @@ def verify(state: TriageState) -> TriageState:
 
     # Check that we have a valid recommendation
     if error:
-        log.error(f"FAILED: {error}")
-        return {**state, "verified": False}
+        log.error("FAILED: %s", error)
+        return {"verified": False}
 
     if not recommendation.get("next_action"):
         log.error("FAILED: No next action generated")
-        return {**state, "verified": False, "error": "No next action generated"}
+        return {"verified": False, "error": "No next action generated"}
 
     valid_actions = ["escalate", "get_more_info", "reproduce"]
     if recommendation["next_action"] not in valid_actions:
-        log.error(f"FAILED: Invalid next action: {recommendation['next_action']}")
-        return {**state, "verified": False, "error": f"Invalid next action: {recommendation['next_action']}"}
+        log.error("FAILED: Invalid next action: %s", recommendation["next_action"])
+        return {"verified": False, "error": f"Invalid next action: {recommendation['next_action']}"}
 
     # Warn if all data sources failed (degraded run)
     if len(fetch_failures) == 3:
         log.warning("DEGRADED: All data sources failed to fetch - recommendation based on ticket only")
     elif fetch_failures:
-        log.warning(f"PARTIAL: Some data sources failed: {fetch_failures}")
+        log.warning("PARTIAL: Some data sources failed: %s", fetch_failures)
 
     log.info("PASSED")
     log.info("=" * 60)
@@ -530,4 +680,4 @@ def verify(state: TriageState) -> TriageState:
     # Print the final output
     _print_final_output(state)
 
-    return {**state, "verified": True}
+    return {"verified": True}
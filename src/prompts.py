@@ -1,24 +1,26 @@
-"""LLM prompts for classification and analysis."""
+"""LLM prompts for classification and analysis.
 
-CLASSIFY_ISSUE_PROMPT = """You are a support ticket classifier. Analyze the following support ticket and classify it.
+Output shape is enforced by the schemas in schemas.py, so the prompts only
+list the expected fields rather than spelling out full JSON templates.
+"""
+
+CLASSIFY_ISSUE_PROMPT = """Classify this support ticket.
 
-TICKET:
 Subject: {subject}
 Body: {body}
 
-Classify this ticket into ONE of these categories:
-- "frontend": UI issues, display problems, client-side errors, browser issues, CSS/styling, React/JS errors
-- "backend": API errors, server issues, database problems, authentication, data not saving, 500 errors
-- "infra": Deployment issues, downtime, performance/latency, infrastructure, DevOps
-- "unclear": Cannot determine from the description, could be multiple areas
+Categories:
+- frontend: UI, browser, client-side errors
+- backend: API, server, database, auth, 500 errors
+- infra: deployment, downtime, performance/latency
+- unclear: cannot determine or spans areas
 
-Respond with ONLY a JSON object in this exact format:
-{{"issue_type": "<category>", "reasoning": "<brief explanation>"}}
+Return JSON: {{"issue_type": "<category>", "reasoning": "<brief>"}}
 """
 
-ANALYZE_CORRELATION_PROMPT = """You are analyzing whether a support ticket is related to recent code changes or deployed features.
+ANALYZE_CORRELATION_PROMPT = """Is this support ticket related to a recent change, and is it a recurring issue?
 
-SUPPORT TICKET:
+TICKET:
 Subject: {ticket_subject}
 Body: {ticket_body}
 
@@ -28,34 +30,18 @@ RECENT GITHUB PRs (merged to main):
 RECENT LINEAR TICKETS (deployed to production):
 {linear_summary}
 
-RECENT INTERCOM TICKETS (for pattern detection):
+RECENT INTERCOM TICKETS:
 {intercom_summary}
 
-Analyze:
-1. Is this ticket likely related to any of the recent PRs or Linear tickets?
-2. Is this a recurring issue (similar to other recent Intercom tickets)?
-
-Consider:
-- Timing: Did the issue start around when changes were deployed?
-- Keywords: Do ticket keywords match PR/Linear ticket titles or descriptions?
-- Scope: Does the affected area match the changed components?
-
-Respond with ONLY a JSON object in this exact format:
-{{
-    "correlated": true/false,
-    "confidence": 0.0-1.0,
-    "correlation_type": "github_pr" | "linear_ticket" | "none",
-    "matched_item": {{"type": "pr|linear|none", "title": "<title if matched>", "id": "<id if matched>"}} | null,
-    "reason": "<explanation>",
-    "is_recurring": true/false,
-    "related_tickets": ["<ticket_id>", ...] | [],
-    "pattern_summary": "<description of recurring pattern if any>" | null
-}}
+Weigh timing, keyword overlap, and affected area. Only match items listed above.
+
+Return JSON with: correlated (bool), confidence (0.0-1.0), correlation_type ("github_pr"|"linear_ticket"|"none"),
+matched_item ({{"type": "pr"|"linear"|"none", "title", "id"}} or null), reason,
+is_recurring (bool), related_tickets (ticket ids), pattern_summary (or null)
 """
 
-GENERATE_RECOMMENDATION_PROMPT = """You are a support ticket triage assistant. Based on the analysis below, recommend a next action.
+GENERATE_RECOMMENDATION_PROMPT = """Recommend a next action for this support ticket.
 
-TICKET:
 Subject: {ticket_subject}
 Body: {ticket_body}
 
@@ -67,22 +53,11 @@ ANALYSIS:
 - Is recurring pattern: {is_recurring}
 - Related tickets: {related_tickets}
 
-Choose ONE next_action:
-- "escalate": Bug correlates to recent code change or is a recurring pattern
-- "get_more_info": Need more details from customer to diagnose
-- "reproduce": Support should try to reproduce before escalating
-
-Respond with ONLY valid JSON (no other text):
-{{
-    "next_action": "escalate",
-    "next_action_reason": "Brief explanation of why this action was chosen",
-    "suggested_tags": ["tag1", "tag2"],
-    "correlation_summary": "Summary of correlation findings",
-    "questions_for_customer": ["Question 1?", "Question 2?"],
-    "engineering_context": "Relevant context for engineering team if escalating"
-}}
-
-Notes:
-- questions_for_customer: Include if next_action is "get_more_info", otherwise use null or empty list
-- engineering_context: Include if next_action is "escalate", otherwise use null
+next_action is ONE of:
+- escalate: correlates to a recent change or is a recurring pattern
+- get_more_info: need more details from the customer
+- reproduce: support should try to reproduce first
+
+Return JSON with: next_action, next_action_reason, suggested_tags, correlation_summary,
+questions_for_customer (if get_more_info, else null), engineering_context (if escalate, else null)
 """
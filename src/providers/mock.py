@@ -1,5 +1,6 @@
 """Mock Intercom provider for development and testing."""
 
+import bisect
 from datetime import datetime, timedelta
 
 
@@ -14,6 +15,32 @@ class MockIntercomProvider:
         """
         self.mock_data = mock_data
 
+        # Mock data never changes, so parse timestamps once and keep tickets
+        # sorted by creation time; fetch_recent_tickets bisects the cutoff.
+        # A malformed timestamp is kept and raised from fetch_recent_tickets,
+        # so it fails that fetch (as before) rather than the whole provider
+        self._parse_error: Exception | None = None
+        dated = []
+        for ticket_id, ticket in mock_data.get("tickets", {}).items():
+            created_at = ticket.get("created_at")
+            if not created_at:
+                continue
+            try:
+                if isinstance(created_at, str):
+                    created_at = datetime.fromisoformat(created_at)
+                elif not isinstance(created_at, datetime):
+                    # e.g. a bare date, which YAML loads as datetime.date
+                    raise TypeError(
+                        f"Ticket {ticket_id} created_at is {type(created_at).__name__}, not a datetime"
+                    )
+            except (TypeError, ValueError) as e:
+                self._parse_error = self._parse_error or e
+                continue
+            dated.append((created_at.replace(tzinfo=None), ticket_id, ticket))
+        dated.sort(key=lambda item: item[0])
+        self._created_times = [created_at for created_at, _, _ in dated]
+        self._sorted_tickets = [(ticket_id, ticket) for _, ticket_id, ticket in dated]
+
     def fetch_ticket(self, ticket_id: str) -> dict:
         """Fetch a mock ticket by ID.
 
@@ -32,16 +59,8 @@ class MockIntercomProvider:
         Returns:
             list of dicts with keys: id, subject, body, created_at, tags, status
         """
+        if self._parse_error is not None:
+            raise self._parse_error
         cutoff = datetime.now() - timedelta(days=days_back)
-        tickets = self.mock_data.get("tickets", {})
-        recent = []
-
-        for ticket_id, ticket in tickets.items():
-            created_at = ticket.get("created_at")
-            if isinstance(created_at, str):
-                created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-
-            if created_at and created_at.replace(tzinfo=None) >= cutoff:
-                recent.append({"id": ticket_id, **ticket})
-
-        return recent
+        start = bisect.bisect_left(self._created_times, cutoff)
+        return [{"id": ticket_id, **ticket} for ticket_id, ticket in self._sorted_tickets[start:]]
@@ -2,6 +2,17 @@
 
 import os
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+INTERCOM_API_URL = "https://api.intercom.io"
+
+_NOT_IMPLEMENTED_MSG = (
+    "Real Intercom provider not yet implemented. "
+    "Set INTERCOM_MODE=mock to use mock data."
+)
+
 
 class RealIntercomProvider:
     """Provider that connects to the real Intercom API."""
@@ -18,13 +29,20 @@ class RealIntercomProvider:
                 "INTERCOM_ACCESS_TOKEN required when INTERCOM_MODE=real"
             )
 
-        # TODO: Initialize Intercom client
-        # from intercom import Client
-        # self.client = Client(token=access_token)
-        raise NotImplementedError(
-            "Real Intercom provider not yet implemented. "
-            "Set INTERCOM_MODE=mock to use mock data."
-        )
+        # One pooled, keep-alive session for all API calls, retrying rate
+        # limits and transient gateway errors with backoff
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        })
+
+        # Fail at startup rather than on the first ticket mid-graph; remove
+        # once fetch_ticket and fetch_recent_tickets are implemented
+        raise NotImplementedError(_NOT_IMPLEMENTED_MSG)
 
     def fetch_ticket(self, ticket_id: str) -> dict:
         """Fetch a ticket from Intercom API.
@@ -33,16 +51,18 @@ class RealIntercomProvider:
             dict with keys: id, subject, body, customer_email, created_at, tags
         """
         # TODO: Implement real API call
-        # conversation = self.client.conversations.find(id=ticket_id)
+        # response = self._session.get(f"{INTERCOM_API_URL}/conversations/{ticket_id}", timeout=30)
+        # response.raise_for_status()
+        # conversation = response.json()
         # return {
-        #     "id": conversation.id,
-        #     "subject": conversation.source.subject,
-        #     "body": conversation.source.body,
-        #     "customer_email": conversation.source.author.email,
-        #     "created_at": conversation.created_at,
-        #     "tags": [t.name for t in conversation.tags],
+        #     "id": conversation["id"],
+        #     "subject": conversation["source"]["subject"],
+        #     "body": conversation["source"]["body"],
+        #     "customer_email": conversation["source"]["author"]["email"],
+        #     "created_at": conversation["created_at"],
+        #     "tags": [t["name"] for t in conversation["tags"]["tags"]],
         # }
-        raise NotImplementedError()
+        raise NotImplementedError(_NOT_IMPLEMENTED_MSG)
 
     def fetch_recent_tickets(self, days_back: int = 1) -> list[dict]:
         """Fetch recent tickets from Intercom API.
@@ -51,4 +71,5 @@ class RealIntercomProvider:
             list of dicts with keys: id, subject, body, created_at, tags, status
         """
         # TODO: Implement real API call with date filtering
-        raise NotImplementedError()
+        # (POST {INTERCOM_API_URL}/conversations/search via self._session)
+        raise NotImplementedError(_NOT_IMPLEMENTED_MSG)
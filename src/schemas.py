@@ -0,0 +1,49 @@
+"""Structured output schemas for the LLM-powered nodes.
+
+Each model mirrors the JSON format requested by the matching prompt in
+prompts.py and is passed to the chat model's with_structured_output, so
+the model is constrained to emit valid JSON in this shape.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class ClassifyResult(BaseModel):
+    """Output of classify_issue_type."""
+
+    issue_type: Literal["frontend", "backend", "infra", "unclear"]
+    reasoning: str = ""
+
+
+class MatchedItem(BaseModel):
+    """The PR or Linear ticket a support ticket was correlated with."""
+
+    type: Literal["pr", "linear", "none"]
+    title: str = ""
+    id: str | None = None
+
+
+class CorrelationResult(BaseModel):
+    """Output of analyze_correlation."""
+
+    correlated: bool
+    confidence: float
+    correlation_type: Literal["github_pr", "linear_ticket", "none"] = "none"
+    matched_item: MatchedItem | None = None
+    reason: str = ""
+    is_recurring: bool = False
+    related_tickets: list[str] = []
+    pattern_summary: str | None = None
+
+
+class RecommendationResult(BaseModel):
+    """Output of generate_recommendation."""
+
+    next_action: Literal["escalate", "get_more_info", "reproduce"]
+    next_action_reason: str = ""
+    suggested_tags: list[str] = []
+    correlation_summary: str = ""
+    questions_for_customer: list[str] | None = None
+    engineering_context: str | None = None
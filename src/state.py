@@ -18,18 +18,15 @@ def keep_last(current, new):
 
 def merge_lists(current, new):
     """Reducer that merges lists, removing duplicates. For fan-in of list fields."""
-    if current is None:
-        current = []
-    if new is None:
-        new = []
-    # Merge and dedupe while preserving order
+    # Fast paths: most fan-in writes add nothing new or start from empty
+    if not new:
+        return current if current is not None else []
+    if not current:
+        return list(dict.fromkeys(new))
+    # Merge and dedupe while preserving order; never mutates current, which
+    # LangGraph may still hold in an earlier checkpoint
     seen = set(current)
-    merged = list(current)
-    for item in new:
-        if item not in seen:
-            merged.append(item)
-            seen.add(item)
-    return merged
+    return current + [item for item in dict.fromkeys(new) if item not in seen]
 
 
 class TriageState(TypedDict, total=False):
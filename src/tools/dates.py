@@ -0,0 +1,17 @@
+"""Date helpers shared by the fetch tools."""
+
+import functools
+from datetime import datetime
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_ref(reference_date: str) -> datetime:
+    """Parse an ISO date string to a naive datetime, memoized across retries."""
+    return datetime.fromisoformat(reference_date).replace(tzinfo=None)
+
+
+def reference_datetime(reference_date: str | None) -> datetime:
+    """Return the datetime to treat as "today": reference_date if given, else now."""
+    if reference_date:
+        return _parse_ref(reference_date)
+    return datetime.now()
@@ -1,9 +1,265 @@
 """GitHub tool for fetching merged PRs."""
 
+import functools
+import itertools
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
-from github import Auth, Github
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .dates import reference_datetime
+
+GITHUB_GRAPHQL_API = "https://api.github.com/graphql"
+
+# One search query returns a page of merged PRs with their changed files;
+# the server filters by merge date, so unmerged or stale PRs are never sent
+MERGED_PRS_QUERY = """
+query($query: String!, $cursor: String) {
+    search(type: ISSUE, query: $query, first: 50, after: $cursor) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {
+            ... on PullRequest {
+                id
+                title
+                body
+                mergedAt
+                author {
+                    login
+                }
+                files(first: 100) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    nodes {
+                        path
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# Follow-up pages of changed files, only for PRs touching more than 100 files
+PR_FILES_QUERY = """
+query($id: ID!, $cursor: String) {
+    node(id: $id) {
+        ... on PullRequest {
+            files(first: 100, after: $cursor) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {
+                    path
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Shared HTTP session so repeated fetches reuse keep-alive connections.
+
+    The pool is sized for the concurrent per-repo fetches. GraphQL queries
+    are read-only, so POSTs are safe to retry on rate limits and gateway errors.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["POST"],
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def _token_cycle(raw_tokens: str) -> "itertools.cycle[str] | None":
+    """Round-robin iterator over a comma-separated token list, or None if empty."""
+    tokens = [t.strip() for t in raw_tokens.split(",") if t.strip()]
+    return itertools.cycle(tokens) if tokens else None
+
+
+_token_lock = threading.Lock()
+
+
+def _get_token_cycle() -> "itertools.cycle[str] | None":
+    """Token rotation from GITHUB_TOKENS (comma-separated), falling back to GITHUB_TOKEN.
+
+    Each repo fetch takes the next token, so concurrent fetches spread across
+    the tokens' separate rate limits.
+    """
+    return _token_cycle(os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_TOKEN", ""))
+
+
+def _next_token(tokens: "itertools.cycle[str]") -> str:
+    """Take the next token; itertools.cycle is not safe to advance from several threads."""
+    with _token_lock:
+        return next(tokens)
+
+
+def _graphql(token: str, query: str, variables: dict) -> dict:
+    """POST a GraphQL query to GitHub and return its data, raising on API errors."""
+    response = _get_session().post(
+        GITHUB_GRAPHQL_API,
+        headers={"Authorization": f"bearer {token}"},
+        json={"query": query, "variables": variables},
+        timeout=30,
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    if "errors" in data:
+        raise ValueError(f"GitHub API error: {data['errors']}")
+    return data["data"]
+
+
+def _search_merged_prs(token: str, repo_name: str, first_day: date, last_day: date) -> list[dict]:
+    """Fetch PRs merged to main in one repo on the given UTC days (inclusive)."""
+    search_query = (
+        f"repo:{repo_name} is:pr is:merged base:main "
+        f"merged:{first_day.isoformat()}T00:00:00+00:00..{last_day.isoformat()}T23:59:59+00:00 "
+        "sort:updated-desc"
+    )
+    prs = []
+    cursor = None
+
+    while True:
+        results = _graphql(token, MERGED_PRS_QUERY, {"query": search_query, "cursor": cursor})["search"]
+        for pr in results["nodes"]:
+            merged_at = datetime.fromisoformat(pr["mergedAt"])
+            files = pr["files"]
+            files_changed = [f["path"] for f in files["nodes"]]
+            if files["pageInfo"]["hasNextPage"]:
+                files_changed += _remaining_files(token, pr["id"], files["pageInfo"]["endCursor"])
+            prs.append({
+                "title": pr["title"],
+                "description": pr["body"] or "",
+                "author": pr["author"]["login"] if pr["author"] else "ghost",
+                "merged_at": merged_at.isoformat(),
+                "files_changed": files_changed,
+                "repo": repo_name,
+            })
+
+        if not results["pageInfo"]["hasNextPage"]:
+            return prs
+        cursor = results["pageInfo"]["endCursor"]
+
+
+def _remaining_files(token: str, pr_id: str, cursor: str) -> list[str]:
+    """Changed file paths of a PR after its first page, following every page."""
+    paths = []
+    while True:
+        files = _graphql(token, PR_FILES_QUERY, {"id": pr_id, "cursor": cursor})["node"]["files"]
+        paths.extend(f["path"] for f in files["nodes"])
+        if not files["pageInfo"]["hasNextPage"]:
+            return paths
+        cursor = files["pageInfo"]["endCursor"]
+
+
+# Merged PRs cached per (repo, UTC merge day), so widening the window 1 -> 3 -> 7
+# days only fetches the newly added days. Older days are final; today can still
+# gain merges and the search index lags behind merges, so buckets for the last
+# PR_CACHE_RECENT_DAYS days expire after PR_CACHE_TODAY_TTL seconds. Eviction
+# is least-recently-used, so the hot recent days stay cached.
+PR_CACHE_TODAY_TTL = 300
+PR_CACHE_RECENT_DAYS = 2
+PR_CACHE_MAX_BUCKETS = 4096
+_pr_day_cache: "OrderedDict[tuple[str, date], tuple[list[dict], float | None]]" = OrderedDict()
+_pr_cache_lock = threading.Lock()
+
+# GitHub search returns at most this many results per query
+GITHUB_SEARCH_CAP = 1000
+
+
+def _day_range(first_day: date, last_day: date) -> list[date]:
+    """Every date from first_day to last_day, inclusive."""
+    return [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+
+
+def _fetch_one_repo(token: str, repo_name: str, since: datetime) -> list[dict]:
+    """Fetch PRs merged to main in one repo since the given time."""
+    try:
+        today = datetime.now(timezone.utc).date()
+        days = _day_range(since.date(), today)
+        now = time.monotonic()
+
+        with _pr_cache_lock:
+            buckets = {}
+            for day in days:
+                key = (repo_name, day)
+                entry = _pr_day_cache.get(key)
+                if entry and (entry[1] is None or entry[1] > now):
+                    buckets[day] = entry[0]
+                    _pr_day_cache.move_to_end(key)
+
+        # Fetch each contiguous run of uncached days with a single search
+        missing = [day for day in days if day not in buckets]
+        runs = []
+        for day in missing:
+            if runs and day - runs[-1][1] == timedelta(days=1):
+                runs[-1][1] = day
+            else:
+                runs.append([day, day])
+
+        recent_from = today - timedelta(days=PR_CACHE_RECENT_DAYS - 1)
+        while runs:
+            first_day, last_day = runs.pop()
+            prs = _search_merged_prs(token, repo_name, first_day, last_day)
+            capped = len(prs) >= GITHUB_SEARCH_CAP
+            if capped and first_day < last_day:
+                # Results past the cap are dropped; split the run and search each half
+                mid = first_day + (last_day - first_day) // 2
+                runs += [[first_day, mid], [mid + timedelta(days=1), last_day]]
+                continue
+
+            fetched = {day: [] for day in _day_range(first_day, last_day)}
+            for pr in prs:
+                # Search dates can disagree with merged_at near day edges; only
+                # file PRs under the days this run owns, never a cached bucket
+                day = date.fromisoformat(pr["merged_at"][:10])
+                if day in fetched:
+                    fetched[day].append(pr)
+            buckets.update(fetched)
+            if capped:
+                continue  # A single day over the cap is incomplete; don't cache it
+
+            with _pr_cache_lock:
+                for day, day_prs in fetched.items():
+                    expires = None if day < recent_from else now + PR_CACHE_TODAY_TTL
+                    _pr_day_cache[(repo_name, day)] = (day_prs, expires)
+                    _pr_day_cache.move_to_end((repo_name, day))
+                while len(_pr_day_cache) > PR_CACHE_MAX_BUCKETS:
+                    _pr_day_cache.popitem(last=False)  # Least recently used
+
+        # Newest day first; buckets are day-granular, so apply the exact cutoff.
+        # merged_at is a whole-second UTC isoformat string, so comparing it with
+        # since in the same format orders exactly like the datetimes would.
+        since_iso = since.replace(tzinfo=timezone.utc).isoformat()
+        return [
+            dict(pr)
+            for day in reversed(days)
+            for pr in buckets.get(day, [])
+            if pr["merged_at"] >= since_iso
+        ]
+    except Exception as e:
+        print(f"Warning: Failed to fetch PRs from {repo_name}: {e}")
+        return []
 
 
 def fetch_github_prs(
@@ -11,6 +267,8 @@ def fetch_github_prs(
 ) -> list[dict]:
     """Fetch PRs merged to main in specified repos.
 
+    Repos are fetched concurrently; results keep the order of `repos`.
+
     Args:
         repos: List of repo names (e.g., ["owner/repo-name"])
         days_back: How many days back to search
@@ -19,39 +277,20 @@ def fetch_github_prs(
     Returns:
         list of dicts with keys: title, description, author, merged_at, files_changed, repo
     """
-    token = os.environ.get("GITHUB_TOKEN")
-    if not token:
+    if not repos:
+        return []
+
+    tokens = _get_token_cycle()
+    if tokens is None:
         raise ValueError("GITHUB_TOKEN environment variable not set")
 
-    g = Github(auth=Auth.Token(token))
-    if reference_date:
-        base_date = datetime.fromisoformat(reference_date.replace("Z", "+00:00")).replace(tzinfo=None)
-    else:
-        base_date = datetime.now()
-    since = base_date - timedelta(days=days_back)
+    since = reference_datetime(reference_date) - timedelta(days=days_back)
     prs = []
 
-    for repo_name in repos:
-        try:
-            repo = g.get_repo(repo_name)
-            pulls = repo.get_pulls(state="closed", base="main", sort="updated", direction="desc")
-
-            for pr in pulls:
-                if not pr.merged or not pr.merged_at:
-                    continue
-
-                if pr.merged_at.replace(tzinfo=None) < since:
-                    break  # PRs are sorted by update time, so we can stop
-
-                prs.append({
-                    "title": pr.title,
-                    "description": pr.body or "",
-                    "author": pr.user.login,
-                    "merged_at": pr.merged_at.isoformat(),
-                    "files_changed": [f.filename for f in pr.get_files()],
-                    "repo": repo_name,
-                })
-        except Exception as e:
-            print(f"Warning: Failed to fetch PRs from {repo_name}: {e}")
+    with ThreadPoolExecutor(max_workers=len(repos)) as pool:
+        for repo_prs in pool.map(
+            lambda repo_name: _fetch_one_repo(_next_token(tokens), repo_name, since), repos
+        ):
+            prs.extend(repo_prs)
 
     return prs
@@ -1,12 +1,166 @@
 """Linear tool for fetching deployed tickets."""
 
+import functools
+import json
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import Future
+from datetime import timedelta
 
-import requests
+import httpx
+
+from .dates import reference_datetime
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # fall back to stdlib json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
 
 LINEAR_API = "https://api.linear.app/graphql"
 
+# Retry policy for rate limits and transient gateway errors, matching the
+# GitHub client: up to LINEAR_RETRIES retries, sleeping 0.5s, 1s, 2s between them
+LINEAR_RETRIES = 3
+LINEAR_RETRY_BACKOFF = 0.5
+LINEAR_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+DEPLOYED_ISSUES_IN_PROJECTS_QUERY = """
+query($since: DateTimeOrDuration!, $projects: [String!]!) {
+    issues(
+        filter: {
+            state: { name: { eq: "Deployed to Prod" } }
+            updatedAt: { gte: $since }
+            project: { name: { in: $projects } }
+        }
+        first: 100
+    ) {
+        nodes {
+            id
+            title
+            description
+            updatedAt
+            labels {
+                nodes {
+                    name
+                }
+            }
+            project {
+                name
+            }
+        }
+    }
+}
+"""
+
+DEPLOYED_ISSUES_QUERY = """
+query($since: DateTimeOrDuration!) {
+    issues(
+        filter: {
+            state: { name: { eq: "Deployed to Prod" } }
+            updatedAt: { gte: $since }
+        }
+        first: 100
+    ) {
+        nodes {
+            id
+            title
+            description
+            updatedAt
+            labels {
+                nodes {
+                    name
+                }
+            }
+            project {
+                name
+            }
+        }
+    }
+}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """Shared HTTP/2 client: one keep-alive connection multiplexes concurrent fetches.
+
+    The transport retries failed connection attempts; status-based retries
+    (429/5xx) are handled by _post_with_retry.
+    """
+    return httpx.Client(transport=httpx.HTTPTransport(http2=True, retries=LINEAR_RETRIES))
+
+
+def _post_with_retry(api_key: str, body: bytes) -> httpx.Response:
+    """POST a request body to Linear, retrying rate limits and gateway errors with backoff.
+
+    GraphQL queries are read-only, so the POST is safe to repeat.
+    """
+    for attempt in range(LINEAR_RETRIES + 1):
+        response = _get_client().post(
+            LINEAR_API,
+            headers={
+                "Authorization": api_key,
+                "Content-Type": "application/json",
+            },
+            content=body,
+            timeout=30,
+        )
+        if response.status_code not in LINEAR_RETRY_STATUSES or attempt == LINEAR_RETRIES:
+            break
+        time.sleep(LINEAR_RETRY_BACKOFF * 2**attempt)
+    response.raise_for_status()
+    return response
+
+
+@functools.lru_cache(maxsize=8)
+def _payload_prefix(query: str) -> bytes:
+    """The JSON request body up to its variables, encoded once per query."""
+    return _dumps({"query": query})[:-1] + b',"variables":'
+
+
+# Identical queries already in flight, keyed by (api_key, request body)
+_inflight: dict[tuple[str, bytes], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _post_query(api_key: str, query: str, variables: dict) -> dict:
+    """POST a GraphQL query to Linear and return the decoded response.
+
+    Concurrent triage runs in this process over the same window (e.g.
+    run_triage_batch) send byte-identical queries; those share one in-flight
+    request instead of each making their own POST. Separate processes, such
+    as evals --workers, do not share requests. The returned dict may be
+    shared between callers, so treat it as read-only.
+    """
+    body = _payload_prefix(query) + _dumps(variables) + b"}"
+    key = (api_key, body)
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        data = _loads(_post_with_retry(api_key, body).content)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(data)
+        return data
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
 
 def fetch_linear_tickets(
     days_back: int = 1,
@@ -17,95 +171,34 @@ def fetch_linear_tickets(
 
     Args:
         days_back: How many days back to search
-        projects: Optional list of project names to filter by. If None, fetches from all projects.
+        projects: Optional list of project names to filter by. If None, fetches from all projects;
+            an empty list matches no projects and returns [] without querying.
         reference_date: ISO date string to use as "today". If None, uses actual today.
 
     Returns:
         list of dicts with keys: title, description, labels, deployed_at, project
     """
+    if projects is not None and not projects:
+        return []
+
     api_key = os.environ.get("LINEAR_API_KEY")
     if not api_key:
         raise ValueError("LINEAR_API_KEY environment variable not set")
 
-    if reference_date:
-        base_date = datetime.fromisoformat(reference_date.replace("Z", "+00:00")).replace(tzinfo=None)
-    else:
-        base_date = datetime.now()
-    since = base_date - timedelta(days=days_back)
+    # Floor to the minute so runs started moments apart send identical
+    # variables and can share one request in _post_query
+    since = reference_datetime(reference_date) - timedelta(days=days_back)
+    since = since.replace(second=0, microsecond=0)
 
-    # Build filter with optional project constraint
+    # Pick the query with or without the project constraint
     if projects:
-        query = """
-        query($since: DateTimeOrDuration!, $projects: [String!]!) {
-            issues(
-                filter: {
-                    state: { name: { eq: "Deployed to Prod" } }
-                    updatedAt: { gte: $since }
-                    project: { name: { in: $projects } }
-                }
-                first: 100
-            ) {
-                nodes {
-                    id
-                    title
-                    description
-                    updatedAt
-                    labels {
-                        nodes {
-                            name
-                        }
-                    }
-                    project {
-                        name
-                    }
-                }
-            }
-        }
-        """
+        query = DEPLOYED_ISSUES_IN_PROJECTS_QUERY
         variables = {"since": since.isoformat(), "projects": projects}
     else:
-        query = """
-        query($since: DateTimeOrDuration!) {
-            issues(
-                filter: {
-                    state: { name: { eq: "Deployed to Prod" } }
-                    updatedAt: { gte: $since }
-                }
-                first: 100
-            ) {
-                nodes {
-                    id
-                    title
-                    description
-                    updatedAt
-                    labels {
-                        nodes {
-                            name
-                        }
-                    }
-                    project {
-                        name
-                    }
-                }
-            }
-        }
-        """
+        query = DEPLOYED_ISSUES_QUERY
         variables = {"since": since.isoformat()}
 
-    response = requests.post(
-        LINEAR_API,
-        headers={
-            "Authorization": api_key,
-            "Content-Type": "application/json",
-        },
-        json={
-            "query": query,
-            "variables": variables,
-        },
-        timeout=30,
-    )
-    response.raise_for_status()
-    data = response.json()
+    data = _post_query(api_key, query, variables)
 
     if "errors" in data:
         raise ValueError(f"Linear API error: {data['errors']}")
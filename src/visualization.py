@@ -1,18 +1,21 @@
-"""Graph visualization using Graphviz."""
+"""Graph visualization using Graphviz.
 
-import graphviz
+The graph is static, so it is rendered ahead of time to GRAPH_IMAGE_PATH by
+scripts/gen_graph.py; rerun that script after changing the graph. At runtime
+the image is read from disk, and graphviz is only needed if the file is missing.
+"""
 
+import functools
+import shutil
+from pathlib import Path
 
-def get_graph_image() -> bytes:
-    """Get the triage graph as a PNG image.
+GRAPH_IMAGE_PATH = Path(__file__).parent / "_graph.png"
 
-    Returns:
-        PNG image bytes that can be displayed with IPython.display.Image
 
-    Requires:
-        - graphviz Python package: pip install graphviz
-        - Graphviz system install: brew install graphviz (macOS)
-    """
+def _build_dot():
+    """Build the Graphviz description of the triage graph (a graphviz.Digraph)."""
+    import graphviz
+
     dot = graphviz.Digraph(
         comment="Triage Graph",
         graph_attr={
@@ -55,30 +58,34 @@ def get_graph_image() -> bytes:
     dot.node("fetch_github", "fetch_github\n(GitHub API)", **tool_agent_style)
     dot.node("fetch_linear", "fetch_linear\n(Linear API)", **tool_agent_style)
     dot.node("fetch_intercom", "fetch_intercom\n(Mock/API)", **tool_agent_style)
+    dot.node("filter_prs", "filter_prs\n(target repos)", **orchestrator_style)
 
     # Decision/loop node
     dot.node("widen_window", "widen_window\n(retry loop)", **decision_style)
 
-    # Keep tool agents on same rank for fan-out visualization
+    # Keep classification and tool agents on same rank for fan-out visualization
     with dot.subgraph() as s:
         s.attr(rank="same")
+        s.node("classify_issue_type")
         s.node("fetch_github")
         s.node("fetch_linear")
         s.node("fetch_intercom")
 
     # Main flow edges
     dot.edge("__start__", "intake")
-    dot.edge("intake", "classify_issue_type")
 
-    # Fan-out: classify -> tool agents
-    dot.edge("classify_issue_type", "fetch_github")
-    dot.edge("classify_issue_type", "fetch_linear")
-    dot.edge("classify_issue_type", "fetch_intercom")
+    # Fan-out: intake -> classify + tool agents
+    dot.edge("intake", "classify_issue_type")
+    dot.edge("intake", "fetch_github")
+    dot.edge("intake", "fetch_linear")
+    dot.edge("intake", "fetch_intercom")
 
-    # Fan-in: tool agents -> analyze
-    dot.edge("fetch_github", "analyze_correlation")
-    dot.edge("fetch_linear", "analyze_correlation")
-    dot.edge("fetch_intercom", "analyze_correlation")
+    # Fan-in: classify + tool agents -> filter -> analyze
+    dot.edge("classify_issue_type", "filter_prs")
+    dot.edge("fetch_github", "filter_prs")
+    dot.edge("fetch_linear", "filter_prs")
+    dot.edge("fetch_intercom", "filter_prs")
+    dot.edge("filter_prs", "analyze_correlation")
 
     # Conditional routing after analysis
     dot.edge("analyze_correlation", "generate_recommendation", label="correlated /\nnot_correlated")
@@ -93,7 +100,31 @@ def get_graph_image() -> bytes:
     dot.edge("generate_recommendation", "verify")
     dot.edge("verify", "__end__")
 
-    return dot.pipe(format="png")
+    return dot
+
+
+def render_graph_image(path: str | Path = GRAPH_IMAGE_PATH):
+    """Render the graph to a PNG file with Graphviz.
+
+    Requires:
+        - graphviz Python package: pip install -r requirements-dev.txt
+        - Graphviz system install: brew install graphviz (macOS)
+    """
+    # dot writes the PNG straight to disk; cleanup removes the intermediate .gv source
+    _build_dot().render(outfile=str(path), format="png", cleanup=True)
+
+
+# The graph is static, so load (or render) it once per process
+@functools.lru_cache(maxsize=1)
+def get_graph_image() -> bytes:
+    """Get the triage graph as a PNG image.
+
+    Returns:
+        PNG image bytes that can be displayed with IPython.display.Image
+    """
+    if GRAPH_IMAGE_PATH.exists():
+        return GRAPH_IMAGE_PATH.read_bytes()
+    return _build_dot().pipe(format="png")
 
 
 def save_graph_image(path: str = "graph.png"):
@@ -102,7 +133,8 @@ def save_graph_image(path: str = "graph.png"):
     Args:
         path: Output file path
     """
-    png_bytes = get_graph_image()
-    with open(path, "wb") as f:
-        f.write(png_bytes)
+    if GRAPH_IMAGE_PATH.exists():
+        shutil.copyfile(GRAPH_IMAGE_PATH, path)
+    else:
+        render_graph_image(path)
     print(f"Graph saved to {path}")
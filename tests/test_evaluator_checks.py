@@ -0,0 +1,109 @@
+"""Offline tests for the eval check registry and hallucination check.
+
+Run with: pytest tests/test_evaluator_checks.py -v
+
+The graph is replaced by a stub app that returns a fixed final state.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from evals.evaluator import TriageEvaluator, _check_no_hallucination
+
+GOOD_STATE = {
+    "verified": True,
+    "error": None,
+    "issue_type": "backend",
+    "target_repos": ["acme/backend"],
+    "retry_count": 1,
+    "correlation_result": {"correlated": False, "confidence": 0.9},
+    "recommendation": {"next_action": "reproduce", "suggested_tags": []},
+}
+
+
+def _case(checks: dict) -> dict:
+    return {
+        "id": "T-01",
+        "category": "task_completion",
+        "description": "stub",
+        "ticket_id": "ticket-001",
+        "checks": checks,
+    }
+
+
+def _run(evaluator, checks: dict, state: dict = GOOD_STATE):
+    app = SimpleNamespace(invoke=lambda initial_state: dict(state))
+    provider = SimpleNamespace(fetch_ticket=lambda ticket_id: {"id": ticket_id})
+    return evaluator.run_single(_case(checks), app, provider)
+
+
+@pytest.fixture
+def evaluator():
+    return TriageEvaluator("evals/golden_set.yaml")
+
+
+class TestCheckRegistry:
+    """Tests for how run_single dispatches configured checks."""
+
+    def test_runs_configured_checks(self, evaluator):
+        """Configured checks run and pass against a good final state."""
+        result = _run(evaluator, {"graph_completed": True, "no_error": True, "max_retry_count": 2})
+
+        assert result.passed
+        assert result.checks == {"graph_completed": True, "no_error": True, "max_retry_count": True}
+
+    def test_false_flag_and_unknown_checks_are_skipped(self, evaluator):
+        """A flag check set to false, or an unknown name, does not run."""
+        result = _run(evaluator, {"no_error": False, "not_a_check": True, "graph_completed": True})
+
+        assert result.checks == {"graph_completed": True}
+
+    def test_no_checks_is_not_a_pass(self, evaluator):
+        """A case with no runnable checks fails rather than passing vacuously."""
+        assert not _run(evaluator, {"no_error": False}).passed
+
+    def test_details_kept_for_failures_and_always_detail_checks(self, evaluator):
+        """Passing checks drop their details, except max_retry_count."""
+        result = _run(evaluator, {"has_error": True, "no_error": True, "max_retry_count": 2})
+
+        assert not result.passed
+        assert set(result.details) == {"has_error", "max_retry_count"}
+
+    def test_fail_fast_stops_at_first_failure(self):
+        """With fail_fast, checks after the first failure are not run."""
+        evaluator = TriageEvaluator("evals/golden_set.yaml", fail_fast=True)
+        result = _run(evaluator, {"has_error": True, "no_error": True})
+
+        assert result.checks == {"has_error": False}
+
+
+class TestNoHallucination:
+    """Tests for _check_no_hallucination."""
+
+    def _state(self, matched_item, linear_tickets=(), prs=()):
+        return {
+            "correlation_result": {"correlated": True, "matched_item": matched_item},
+            "recent_linear_tickets": list(linear_tickets),
+            "recent_prs": list(prs),
+        }
+
+    def test_uncorrelated_passes(self):
+        assert _check_no_hallucination({"correlation_result": {"correlated": False}})
+
+    def test_exact_linear_id_passes(self):
+        state = self._state({"id": "ENG-42", "title": "Something else"}, [{"id": "ENG-42", "title": "Fix login"}])
+        assert _check_no_hallucination(state)
+
+    def test_matching_pr_title_passes(self):
+        state = self._state({"title": "Fix login redirect"}, prs=[{"title": "Fix login redirect loop"}])
+        assert _check_no_hallucination(state)
+
+    def test_empty_id_does_not_match_empty_fetched_id(self):
+        """An empty matched id is not a match, even if a fetched ticket has no id."""
+        state = self._state({"id": "", "title": "Invented ticket"}, [{"id": "", "title": "Fix login"}])
+        assert not _check_no_hallucination(state)
+
+    def test_unknown_item_fails(self):
+        state = self._state({"id": "ENG-99", "title": "Invented ticket"}, [{"id": "ENG-42", "title": "Fix login"}])
+        assert not _check_no_hallucination(state)
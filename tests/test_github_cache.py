@@ -0,0 +1,137 @@
+"""Offline tests for the per-day GitHub PR cache.
+
+Run with: pytest tests/test_github_cache.py -v
+
+_search_merged_prs is stubbed, so no token or network access is needed.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools import github
+
+REPO = "owner/repo"
+
+
+def _pr(repo_name: str, day: date) -> dict:
+    return {
+        "title": f"{repo_name} {day.isoformat()}",
+        "description": "",
+        "author": "dev",
+        "merged_at": datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc).isoformat(),
+        "files_changed": [],
+        "repo": repo_name,
+    }
+
+
+def _since(days_back: int) -> datetime:
+    """Midnight days_back UTC days ago, as the naive datetime callers pass."""
+    day = datetime.now(timezone.utc).date() - timedelta(days=days_back)
+    return datetime(day.year, day.month, day.day)
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """Stub the GitHub search with one PR per day.
+
+    calls records each (repo, first_day, last_day) searched; PRs appended to
+    extra are returned by every later search as well.
+    """
+    stub = SimpleNamespace(calls=[], extra=[])
+
+    def fake_search(token, repo_name, first_day, last_day):
+        stub.calls.append((repo_name, first_day, last_day))
+        return [_pr(repo_name, day) for day in github._day_range(first_day, last_day)] + stub.extra
+
+    monkeypatch.setattr(github, "_search_merged_prs", fake_search)
+    monkeypatch.setattr(github, "_pr_day_cache", OrderedDict())
+    return stub
+
+
+class TestPrDayCache:
+    """Tests for the per-(repo, day) merged PR cache."""
+
+    def test_widening_fetches_only_new_days(self, searches):
+        """Widening 1 -> 3 days searches just the two added days."""
+        today = datetime.now(timezone.utc).date()
+
+        first = github._fetch_one_repo("token", REPO, _since(1))
+        second = github._fetch_one_repo("token", REPO, _since(3))
+
+        assert searches.calls == [
+            (REPO, today - timedelta(days=1), today),
+            (REPO, today - timedelta(days=3), today - timedelta(days=2)),
+        ]
+        assert len(first) == 2
+        assert [pr["merged_at"][:10] for pr in second] == [
+            (today - timedelta(days=i)).isoformat() for i in range(4)
+        ]
+
+    def test_repeat_call_is_served_from_cache(self, searches):
+        """An identical window makes no further searches."""
+        github._fetch_one_repo("token", REPO, _since(2))
+        github._fetch_one_repo("token", REPO, _since(2))
+
+        assert len(searches.calls) == 1
+
+    def test_recent_days_expire_after_ttl(self, searches, monkeypatch):
+        """Today and yesterday are refetched once their TTL passes; older days are final."""
+        today = datetime.now(timezone.utc).date()
+        now = github.time.monotonic()
+
+        github._fetch_one_repo("token", REPO, _since(3))
+        monkeypatch.setattr(
+            github.time, "monotonic", lambda: now + github.PR_CACHE_TODAY_TTL + 1
+        )
+        github._fetch_one_repo("token", REPO, _since(3))
+
+        assert searches.calls[1:] == [(REPO, today - timedelta(days=1), today)]
+
+    def test_evicts_least_recently_used(self, searches, monkeypatch):
+        """The cache stays within PR_CACHE_MAX_BUCKETS, keeping recently read days."""
+        today = datetime.now(timezone.utc).date()
+        monkeypatch.setattr(github, "PR_CACHE_MAX_BUCKETS", 3)
+
+        github._fetch_one_repo("token", "owner/a", _since(2))
+        github._fetch_one_repo("token", "owner/a", _since(0))  # Hit: today is now most recent
+        github._fetch_one_repo("token", "owner/b", _since(0))
+
+        assert list(github._pr_day_cache) == [
+            ("owner/a", today - timedelta(days=1)),
+            ("owner/a", today),
+            ("owner/b", today),
+        ]
+
+    def test_capped_search_splits_and_skips_caching(self, searches, monkeypatch):
+        """A run hitting the search cap is split; a single capped day isn't cached."""
+        today = datetime.now(timezone.utc).date()
+        monkeypatch.setattr(github, "GITHUB_SEARCH_CAP", 1)
+
+        prs = github._fetch_one_repo("token", REPO, _since(3))
+
+        # With one PR per day every search is capped: 4 days -> 2 + 2 -> 1 + 1 + 1 + 1
+        assert len(searches.calls) == 7
+        assert len(prs) == 4
+        assert not github._pr_day_cache
+
+        searches.calls.clear()
+        monkeypatch.setattr(github, "GITHUB_SEARCH_CAP", 1000)
+        github._fetch_one_repo("token", REPO, _since(0))
+        assert searches.calls == [(REPO, today, today)]
+
+    def test_ignores_prs_outside_the_fetched_run(self, searches):
+        """A search result dated outside its run doesn't touch cached buckets."""
+        today = datetime.now(timezone.utc).date()
+
+        github._fetch_one_repo("token", REPO, _since(1))
+        searches.extra.append({**_pr(REPO, today), "title": "stray"})
+        prs = github._fetch_one_repo("token", REPO, _since(3))
+
+        assert "stray" not in [pr["title"] for pr in prs]
+        assert len(prs) == 4
+        assert [pr["title"] for pr in github._pr_day_cache[(REPO, today)][0]] == [
+            _pr(REPO, today)["title"]
+        ]
@@ -0,0 +1,52 @@
+"""Offline tests for the GitHub merged-PR search.
+
+Run with: pytest tests/test_github_search.py -v
+
+_graphql is stubbed with canned responses, so no token or network access is needed.
+"""
+
+from datetime import date
+
+from src.tools import github
+
+
+def _page(paths, cursor=None):
+    return {
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        "nodes": [{"path": p} for p in paths],
+    }
+
+
+class TestSearchMergedPrs:
+    """Tests for _search_merged_prs."""
+
+    def test_follows_file_pages_past_the_first_100(self, monkeypatch):
+        """A PR with more files than one page gets every path, in order."""
+        first_page = [f"src/{i}.py" for i in range(100)]
+        calls = []
+
+        def fake_graphql(token, query, variables):
+            calls.append(variables)
+            if query is github.MERGED_PRS_QUERY:
+                return {"search": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [{
+                        "id": "PR_1",
+                        "title": "Big refactor",
+                        "body": None,
+                        "mergedAt": "2026-01-20T10:00:00Z",
+                        "author": None,
+                        "files": _page(first_page, cursor="f1"),
+                    }],
+                }}
+            pages = {"f1": _page(["a.py"], cursor="f2"), "f2": _page(["b.py"])}
+            return {"node": {"files": pages[variables["cursor"]]}}
+
+        monkeypatch.setattr(github, "_graphql", fake_graphql)
+        prs = github._search_merged_prs("token", "owner/repo", date(2026, 1, 20), date(2026, 1, 20))
+
+        assert len(prs) == 1
+        assert prs[0]["files_changed"] == first_page + ["a.py", "b.py"]
+        assert prs[0]["author"] == "ghost"
+        assert prs[0]["description"] == ""
+        assert [c.get("id") for c in calls] == [None, "PR_1", "PR_1"]
@@ -11,6 +11,20 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+LINEAR_API = "https://api.linear.app/graphql"
+
+
+@pytest.fixture(scope="module")
+def linear_session():
+    """Authenticated session shared by the raw-API tests, so the TLS handshake happens once."""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": os.environ.get("LINEAR_API_KEY", ""),
+        "Content-Type": "application/json",
+    })
+    yield session
+    session.close()
+
 
 class TestLinearIntegration:
     """Tests for Linear API integration."""
@@ -20,10 +34,8 @@ class TestLinearIntegration:
         token = os.environ.get("LINEAR_API_KEY")
         assert token is not None, "LINEAR_API_KEY not set in environment"
 
-    def test_linear_api_connection(self):
+    def test_linear_api_connection(self, linear_session):
         """Test basic connection to Linear API."""
-        api_key = os.environ.get("LINEAR_API_KEY")
-
         query = """
         query {
             viewer {
@@ -33,25 +45,15 @@ class TestLinearIntegration:
         }
         """
 
-        response = requests.post(
-            "https://api.linear.app/graphql",
-            headers={
-                "Authorization": api_key,
-                "Content-Type": "application/json",
-            },
-            json={"query": query},
-            timeout=30,
-        )
+        response = linear_session.post(LINEAR_API, json={"query": query}, timeout=30)
 
         assert response.status_code == 200, f"API returned {response.status_code}: {response.text}"
         data = response.json()
         assert "data" in data, f"Unexpected response: {data}"
         print(f"\nConnected as: {data['data']['viewer']['name']}")
 
-    def test_list_available_projects(self):
+    def test_list_available_projects(self, linear_session):
         """List all available Linear projects."""
-        api_key = os.environ.get("LINEAR_API_KEY")
-
         query = """
         query {
             projects(first: 50) {
@@ -64,15 +66,7 @@ class TestLinearIntegration:
         }
         """
 
-        response = requests.post(
-            "https://api.linear.app/graphql",
-            headers={
-                "Authorization": api_key,
-                "Content-Type": "application/json",
-            },
-            json={"query": query},
-            timeout=30,
-        )
+        response = linear_session.post(LINEAR_API, json={"query": query}, timeout=30)
 
         assert response.status_code == 200
         data = response.json()
@@ -82,10 +76,8 @@ class TestLinearIntegration:
         for p in projects:
             print(f"  - {p['name']} (state: {p['state']})")
 
-    def test_list_workflow_states(self):
+    def test_list_workflow_states(self, linear_session):
         """List all workflow states."""
-        api_key = os.environ.get("LINEAR_API_KEY")
-
         query = """
         query {
             workflowStates(first: 50) {
@@ -98,15 +90,7 @@ class TestLinearIntegration:
         }
         """
 
-        response = requests.post(
-            "https://api.linear.app/graphql",
-            headers={
-                "Authorization": api_key,
-                "Content-Type": "application/json",
-            },
-            json={"query": query},
-            timeout=30,
-        )
+        response = linear_session.post(LINEAR_API, json={"query": query}, timeout=30)
 
         assert response.status_code == 200
         data = response.json()
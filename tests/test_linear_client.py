@@ -0,0 +1,58 @@
+"""Offline tests for the Linear HTTP client.
+
+Run with: pytest tests/test_linear_client.py -v
+
+Requests go to an httpx.MockTransport, so no API key or network access is needed.
+"""
+
+import httpx
+import pytest
+
+from src.tools import linear
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    """Serve queued (status, body) responses; records how many requests were made."""
+    queue = []
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        status, body = queue.pop(0)
+        return httpx.Response(status, content=body)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(linear, "_get_client", lambda: client)
+    monkeypatch.setattr(linear.time, "sleep", lambda seconds: None)
+    return queue, sent
+
+
+class TestLinearClient:
+    """Tests for _post_query retries."""
+
+    def test_retries_rate_limits_and_gateway_errors(self, responses):
+        queue, sent = responses
+        queue += [(429, b""), (502, b""), (200, b'{"data": {"issues": {"nodes": []}}}')]
+
+        data = linear._post_query("key", linear.DEPLOYED_ISSUES_QUERY, {"since": "2026-01-01T00:00:00"})
+
+        assert data == {"data": {"issues": {"nodes": []}}}
+        assert len(sent) == 3
+        assert sent[0].headers["Authorization"] == "key"
+
+    def test_gives_up_after_max_retries(self, responses):
+        queue, sent = responses
+        queue += [(503, b"")] * (linear.LINEAR_RETRIES + 1)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            linear._post_query("key", linear.DEPLOYED_ISSUES_QUERY, {"since": "2026-01-01T00:00:00"})
+        assert len(sent) == linear.LINEAR_RETRIES + 1
+
+    def test_client_errors_are_not_retried(self, responses):
+        queue, sent = responses
+        queue.append((400, b""))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            linear._post_query("key", linear.DEPLOYED_ISSUES_QUERY, {"since": "2026-01-01T00:00:00"})
+        assert len(sent) == 1
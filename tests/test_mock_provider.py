@@ -0,0 +1,59 @@
+"""Offline tests for the mock Intercom provider.
+
+Run with: pytest tests/test_mock_provider.py -v
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.providers.mock import MockIntercomProvider
+
+
+def _hours_ago(hours: int) -> str:
+    return (datetime.now() - timedelta(hours=hours)).isoformat()
+
+
+class TestMockIntercomProvider:
+    """Tests for MockIntercomProvider lookups."""
+
+    def test_recent_tickets_window(self):
+        """Only tickets created inside the window are returned, oldest first."""
+        provider = MockIntercomProvider({"tickets": {
+            "new": {"created_at": _hours_ago(1)},
+            "old": {"created_at": _hours_ago(100)},
+            "mid": {"created_at": _hours_ago(30)},
+            "undated": {},
+        }})
+
+        assert [t["id"] for t in provider.fetch_recent_tickets(days_back=1)] == ["new"]
+        assert [t["id"] for t in provider.fetch_recent_tickets(days_back=2)] == ["mid", "new"]
+
+    def test_accepts_utc_suffix_and_datetimes(self):
+        provider = MockIntercomProvider({"tickets": {
+            "z": {"created_at": (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")},
+            "dt": {"created_at": datetime.now() - timedelta(hours=2)},
+        }})
+
+        assert {t["id"] for t in provider.fetch_recent_tickets(days_back=1)} == {"z", "dt"}
+
+    def test_bad_created_at_fails_only_recent_lookup(self):
+        """A malformed timestamp doesn't break construction or fetch_ticket."""
+        provider = MockIntercomProvider({"tickets": {"bad": {"created_at": "yesterday", "subject": "s"}}})
+
+        assert provider.fetch_ticket("bad")["subject"] == "s"
+        with pytest.raises(ValueError):
+            provider.fetch_recent_tickets()
+
+    @pytest.mark.parametrize("created_at", [date(2026, 1, 1), 1767225600])
+    def test_non_datetime_created_at_fails_only_recent_lookup(self, created_at):
+        """Values YAML loads as dates or numbers are deferred the same way."""
+        provider = MockIntercomProvider({"tickets": {"odd": {"created_at": created_at}}})
+
+        assert provider.fetch_ticket("odd")["created_at"] == created_at
+        with pytest.raises(TypeError):
+            provider.fetch_recent_tickets()
+
+    def test_unknown_ticket_raises(self):
+        with pytest.raises(ValueError):
+            MockIntercomProvider({"tickets": {}}).fetch_ticket("missing")
@@ -0,0 +1,27 @@
+"""Offline tests for the triage state reducers.
+
+Run with: pytest tests/test_state.py -v
+"""
+
+from src.state import keep_last, merge_lists
+
+
+class TestReducers:
+    """Tests for the fan-in reducers in src.state."""
+
+    def test_keep_last_ignores_none(self):
+        assert keep_last("a", None) == "a"
+        assert keep_last("a", "b") == "b"
+
+    def test_merge_lists_dedupes_in_order(self):
+        assert merge_lists(["github"], ["linear", "github", "linear"]) == ["github", "linear"]
+
+    def test_merge_lists_empty_sides(self):
+        assert merge_lists(None, []) == []
+        assert merge_lists(None, ["a", "a"]) == ["a"]
+        assert merge_lists(["a"], None) == ["a"]
+
+    def test_merge_lists_does_not_mutate_current(self):
+        current = ["github"]
+        merge_lists(current, ["linear"])
+        assert current == ["github"]